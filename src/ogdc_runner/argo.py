@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import random
 import time
 
 from hera.shared import global_config
@@ -60,13 +61,16 @@ def _configure_argo_settings() -> WorkflowsService:
         )
 
     # Setup artifact garbage collection. This will tell argo to remove artifacts
-    # on workflow deletion.
+    # on workflow deletion. Also setup pod garbage collection: pods of
+    # successful steps are deleted as soon as they complete, so they do not
+    # accumulate in the namespace. Pods of failed steps are kept for debugging.
     global_config.set_class_defaults(
         Workflow,
         artifact_gc=models.ArtifactGC(
             strategy="OnWorkflowDeletion",
             service_account_name=argo_service_account_name,
         ),
+        pod_gc=models.PodGC(strategy="OnPodSuccess"),
     )
     workflows_service = WorkflowsService(host=argo_workflows_service_url)
 
@@ -78,24 +82,45 @@ ARGO_WORKFLOW_SERVICE = _configure_argo_settings()
 
 def get_workflow_status(workflow_name: str) -> str | None:
     """Return the given workflow's status (e.g., `'Succeeded'`)"""
-    workflow = ARGO_WORKFLOW_SERVICE.get_workflow(name=workflow_name)
+    # Only request the fields we need. Without a filter, Argo returns the
+    # full workflow, including every template and node status. `metadata` and
+    # `spec` are required by hera's `Workflow` model, so a minimal field from
+    # each is included.
+    workflow = ARGO_WORKFLOW_SERVICE.get_workflow(
+        name=workflow_name,
+        fields="metadata.name,spec.entrypoint,status.phase",
+    )
 
     status: str | None = workflow.status.phase  # type: ignore[union-attr]
 
     return status
 
 
+# Bounds, in seconds, on the interval between workflow status polls.
+WORKFLOW_POLL_INITIAL_INTERVAL = 1.0
+WORKFLOW_POLL_MAX_INTERVAL = 30.0
+
+
 def wait_for_workflow_completion(workflow_name: str) -> None:
+    """Block until the given workflow reaches a terminal state.
+
+    The workflow's status is polled with exponential backoff (plus jitter),
+    starting at `WORKFLOW_POLL_INITIAL_INTERVAL` seconds and capped at
+    `WORKFLOW_POLL_MAX_INTERVAL`, so long-running workflows do not hit the
+    argo server at a fixed rate.
+    """
+    poll_interval = WORKFLOW_POLL_INITIAL_INTERVAL
     while True:
         status = get_workflow_status(workflow_name)
         if status:
             print(f"Workflow status: {status}")
             # Terminal states
-            if status == "Failed":
+            if status in ("Failed", "Error"):
                 raise RuntimeError(f"Workflow with name {workflow_name} failed.")
             if status == "Succeeded":
                 return
-        time.sleep(5)
+        time.sleep(random.uniform(poll_interval / 2, poll_interval))
+        poll_interval = min(poll_interval * 2, WORKFLOW_POLL_MAX_INTERVAL)
 
 
 def submit_workflow(workflow: Workflow, *, wait: bool = False) -> str:
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import posixpath
+
 import fsspec
 import yaml
 
 from ogdc_runner.constants import RECIPE_CONFIG_FILENAME
 from ogdc_runner.models.recipe_config import RecipeConfig
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it is
+# considerably faster than the pure-Python `SafeLoader`.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_recipe_config(recipe_directory: str) -> RecipeConfig:
     """Extract config from a recipe configuration file (meta.yml)."""
-    recipe_path = f"{recipe_directory}/{RECIPE_CONFIG_FILENAME}"
-    with fsspec.open(recipe_path, "rt") as config_file:
-        config_dict = yaml.safe_load(config_file)
+    recipe_path = posixpath.join(recipe_directory, RECIPE_CONFIG_FILENAME)
+    with fsspec.open(recipe_path, "rb") as config_file:
+        config_dict = yaml.load(config_file, Loader=_YAML_LOADER)
 
     config = RecipeConfig(**config_dict, recipe_directory=recipe_directory)
 
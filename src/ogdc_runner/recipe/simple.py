@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import posixpath
+
 import fsspec
 from hera.workflows import (
     Artifact,
@@ -54,12 +56,17 @@ def _cmds_from_simple_recipe(recipe_dir: str) -> list[str]:
         * `/output_dir/`: output written by each command. It is expected that
           each command in a simple recipe will place data in `/output_dir/`.
     """
-    recipe_path = f"{recipe_dir}/{SIMPLE_RECIPE_FILENAME}"
+    recipe_path = posixpath.join(recipe_dir, SIMPLE_RECIPE_FILENAME)
     print(f"Reading recipe from {recipe_path}")
 
+    # Stream the recipe line-by-line rather than reading and splitting the
+    # whole file, so only the filtered commands are kept in memory.
     with fsspec.open(recipe_path, "rt") as f:
-        lines = f.read().split("\n")
-    commands = [line for line in lines if line and not line.startswith("#")]
+        commands = [
+            line
+            for line in (raw_line.rstrip("\n") for raw_line in f)
+            if line and not line.startswith("#")
+        ]
 
     return commands
 
@@ -74,15 +81,17 @@ def make_simple_workflow(recipe_dir: str) -> Workflow:
         entrypoint="steps",
         workflows_service=ARGO_WORKFLOW_SERVICE,
     ) as w:
-        cmd_templates = []
-        for idx, command in enumerate(commands):
-            cmd_template = _make_cmd_template(name=f"run-cmd-{idx}", command=command)
-            cmd_templates.append(cmd_template)
+        # Repeated commands share a single template to keep the workflow spec
+        # small.
+        cmd_templates = {
+            command: _make_cmd_template(name=f"run-cmd-{idx}", command=command)
+            for idx, command in enumerate(dict.fromkeys(commands))
+        }
         fetch_template = _make_fetch_url_template(recipe_config)
         with Steps(name="steps"):
             step = fetch_template()
-            for idx, cmd_template in enumerate(cmd_templates):
-                step = cmd_template(
+            for idx, command in enumerate(commands):
+                step = cmd_templates[command](
                     name=f"step-{idx}",
                     arguments=step.get_artifact("output-dir").with_name("input-dir"),  # type: ignore[union-attr]
                 )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import time
+
 import pytest
 from hera.shared import global_config
-from hera.workflows import Container
+from hera.workflows import Container, Workflow, models
 
-from ogdc_runner.argo import _configure_argo_settings
+from ogdc_runner import argo
+from ogdc_runner.argo import (
+    WORKFLOW_POLL_MAX_INTERVAL,
+    _configure_argo_settings,
+    get_workflow_status,
+    wait_for_workflow_completion,
+)
 
 env_test_settings = [
     # when ENVIRONMENT=dev, the `ogdc-runner` image should be used
@@ -42,3 +50,50 @@ def test__configure_argo_settings_dev(monkeypatch):
     _configure_argo_settings()
     assert global_config.image == "ogdc-runner"
     assert Container().image_pull_policy == "Never"
+
+
+def test__configure_argo_settings_gc():
+    """Test `_configure_argo_settings` sets garbage collection defaults"""
+    _configure_argo_settings()
+    workflow = Workflow()
+    assert workflow.artifact_gc.strategy == "OnWorkflowDeletion"  # type: ignore[union-attr]
+    assert workflow.pod_gc.strategy == "OnPodSuccess"  # type: ignore[union-attr]
+
+
+def test_get_workflow_status_requests_minimal_fields(monkeypatch):
+    """Test `get_workflow_status` only requests the fields it needs from argo"""
+    requested_kwargs = {}
+
+    def _get_workflow(**kwargs):
+        requested_kwargs.update(kwargs)
+        # Mimic the (filtered) response from the argo server.
+        return models.Workflow.model_validate(
+            {
+                "metadata": {"name": kwargs["name"]},
+                "spec": {"entrypoint": "steps"},
+                "status": {"phase": "Running"},
+            }
+        )
+
+    monkeypatch.setattr(argo.ARGO_WORKFLOW_SERVICE, "get_workflow", _get_workflow)
+
+    assert get_workflow_status("test-workflow") == "Running"
+    assert requested_kwargs["fields"] == "metadata.name,spec.entrypoint,status.phase"
+
+
+@pytest.mark.parametrize("final_status", ["Failed", "Error"])
+def test_wait_for_workflow_completion_backoff(final_status, monkeypatch):
+    """Test `wait_for_workflow_completion` backs off and stops on failure"""
+    statuses = iter([None, *(["Running"] * 8), final_status])
+    monkeypatch.setattr(argo, "get_workflow_status", lambda _name: next(statuses))
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        wait_for_workflow_completion("test-workflow")
+
+    assert len(sleeps) == 9
+    # The upper bound on each (jittered) sleep doubles until it is capped.
+    assert sleeps[0] <= 1
+    assert sleeps[-1] >= WORKFLOW_POLL_MAX_INTERVAL / 2
+    assert max(sleeps) <= WORKFLOW_POLL_MAX_INTERVAL
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import shutil
+
+from ogdc_runner.constants import SIMPLE_RECIPE_FILENAME
 from ogdc_runner.recipe import get_recipe_config
+from ogdc_runner.recipe.simple import _cmds_from_simple_recipe, make_simple_workflow
 
 
 def test_get_recipe_config(test_recipe_directory):
@@ -10,3 +14,45 @@ def test_get_recipe_config(test_recipe_directory):
 
     assert config.recipe_directory == test_recipe_directory
     assert config.id == "test-argo-workflow"
+
+
+def test__cmds_from_simple_recipe(tmp_path):
+    (tmp_path / SIMPLE_RECIPE_FILENAME).write_text(
+        "# A comment\n"
+        "mkdir -p /output_dir/foo\n"
+        "\n"
+        "cp /input_dir/* /output_dir/foo/\n"
+    )
+
+    commands = _cmds_from_simple_recipe(str(tmp_path))
+
+    assert commands == ["mkdir -p /output_dir/foo", "cp /input_dir/* /output_dir/foo/"]
+
+
+def test_make_simple_workflow_shares_templates_for_repeated_commands(
+    test_recipe_directory, tmp_path
+):
+    recipe_dir = tmp_path / "recipe"
+    shutil.copytree(test_recipe_directory, recipe_dir)
+    (recipe_dir / SIMPLE_RECIPE_FILENAME).write_text(
+        "cp -r /input_dir/. /output_dir/\n"
+        "ls /input_dir/\n"
+        "cp -r /input_dir/. /output_dir/\n"
+    )
+
+    workflow_spec = make_simple_workflow(str(recipe_dir)).to_dict()["spec"]
+
+    template_names = [template["name"] for template in workflow_spec["templates"]]
+    assert template_names.count("run-cmd-0") == 1
+    assert "run-cmd-2" not in template_names
+
+    steps_template = next(
+        template
+        for template in workflow_spec["templates"]
+        if template["name"] == "steps"
+    )
+    assert [step[0]["template"] for step in steps_template["steps"][1:]] == [
+        "run-cmd-0",
+        "run-cmd-1",
+        "run-cmd-0",
+    ]